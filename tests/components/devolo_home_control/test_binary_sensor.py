@@ -1,4 +1,5 @@
 """Tests for the devolo Home Control binary sensors."""
+from collections.abc import AsyncGenerator
 from unittest.mock import patch
 
 import pytest
@@ -22,60 +23,69 @@ from .mocks import (
     HomeControlMockRemoteControl,
 )
 
+from tests.common import MockConfigEntry
 
-@pytest.mark.usefixtures("mock_zeroconf")
-async def test_binary_sensor(hass: HomeAssistant) -> None:
-    """Test setup and state change of a binary sensor device."""
+BUTTON_ENTITY_ID = f"{DOMAIN}.test_button_1"
+DOOR_ENTITY_ID = f"{DOMAIN}.test_door"
+OVERLOAD_ENTITY_ID = f"{DOMAIN}.test_overload"
+
+
+@pytest.fixture
+async def integration(
+    hass: HomeAssistant, request: pytest.FixtureRequest
+) -> AsyncGenerator[tuple[MockConfigEntry, HomeControlMock], None]:
+    """Set up the integration with the gateway mock passed as parameter."""
     entry = configure_integration(hass)
-    test_gateway = HomeControlMockBinarySensor()
-    test_gateway.devices["Test"].status = 0
+    test_gateway = request.param()
     with patch(
         "homeassistant.components.devolo_home_control.HomeControl",
         side_effect=[test_gateway, HomeControlMock()],
     ):
         await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
+        yield entry, test_gateway
+
+
+@pytest.mark.usefixtures("mock_zeroconf")
+@pytest.mark.parametrize("integration", [HomeControlMockBinarySensor], indirect=True)
+async def test_binary_sensor(
+    hass: HomeAssistant, integration: tuple[MockConfigEntry, HomeControlMock]
+) -> None:
+    """Test setup and state change of a binary sensor device."""
+    _, test_gateway = integration
 
-    state = hass.states.get(f"{DOMAIN}.test_door")
+    state = hass.states.get(DOOR_ENTITY_ID)
     assert state is not None
     assert state.state == STATE_OFF
     assert state.attributes[ATTR_FRIENDLY_NAME] == "Test Door"
 
-    state = hass.states.get(f"{DOMAIN}.test_overload")
+    state = hass.states.get(OVERLOAD_ENTITY_ID)
     assert state is not None
     assert state.attributes[ATTR_FRIENDLY_NAME] == "Test Overload"
     er = entity_registry.async_get(hass)
-    assert (
-        er.async_get(f"{DOMAIN}.test_overload").entity_category
-        == EntityCategory.DIAGNOSTIC
-    )
+    assert er.async_get(OVERLOAD_ENTITY_ID).entity_category == EntityCategory.DIAGNOSTIC
 
     # Emulate websocket message: sensor turned on
     test_gateway.publisher.dispatch("Test", ("Test", True))
     await hass.async_block_till_done()
-    assert hass.states.get(f"{DOMAIN}.test_door").state == STATE_ON
+    assert hass.states.get(DOOR_ENTITY_ID).state == STATE_ON
 
     # Emulate websocket message: device went offline
     test_gateway.devices["Test"].status = 1
     test_gateway.publisher.dispatch("Test", ("Status", False, "status"))
     await hass.async_block_till_done()
-    assert hass.states.get(f"{DOMAIN}.test_door").state == STATE_UNAVAILABLE
+    assert hass.states.get(DOOR_ENTITY_ID).state == STATE_UNAVAILABLE
 
 
 @pytest.mark.usefixtures("mock_zeroconf")
-async def test_remote_control(hass: HomeAssistant) -> None:
+@pytest.mark.parametrize("integration", [HomeControlMockRemoteControl], indirect=True)
+async def test_remote_control(
+    hass: HomeAssistant, integration: tuple[MockConfigEntry, HomeControlMock]
+) -> None:
     """Test setup and state change of a remote control device."""
-    entry = configure_integration(hass)
-    test_gateway = HomeControlMockRemoteControl()
-    test_gateway.devices["Test"].status = 0
-    with patch(
-        "homeassistant.components.devolo_home_control.HomeControl",
-        side_effect=[test_gateway, HomeControlMock()],
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+    _, test_gateway = integration
 
-    state = hass.states.get(f"{DOMAIN}.test_button_1")
+    state = hass.states.get(BUTTON_ENTITY_ID)
     assert state is not None
     assert state.state == STATE_OFF
     assert state.attributes[ATTR_FRIENDLY_NAME] == "Test Button 1"
@@ -83,47 +93,38 @@ async def test_remote_control(hass: HomeAssistant) -> None:
     # Emulate websocket message: button pressed
     test_gateway.publisher.dispatch("Test", ("Test", 1))
     await hass.async_block_till_done()
-    assert hass.states.get(f"{DOMAIN}.test_button_1").state == STATE_ON
+    assert hass.states.get(BUTTON_ENTITY_ID).state == STATE_ON
 
     # Emulate websocket message: button released
     test_gateway.publisher.dispatch("Test", ("Test", 0))
     await hass.async_block_till_done()
-    assert hass.states.get(f"{DOMAIN}.test_button_1").state == STATE_OFF
+    assert hass.states.get(BUTTON_ENTITY_ID).state == STATE_OFF
 
     # Emulate websocket message: device went offline
     test_gateway.devices["Test"].status = 1
     test_gateway.publisher.dispatch("Test", ("Status", False, "status"))
     await hass.async_block_till_done()
-    assert hass.states.get(f"{DOMAIN}.test_button_1").state == STATE_UNAVAILABLE
+    assert hass.states.get(BUTTON_ENTITY_ID).state == STATE_UNAVAILABLE
 
 
-@pytest.mark.usefixtures("mock_zeroconf")
+@pytest.mark.usefixtures("mock_zeroconf", "integration")
+@pytest.mark.parametrize(
+    "integration", [HomeControlMockDisabledBinarySensor], indirect=True
+)
 async def test_disabled(hass: HomeAssistant) -> None:
     """Test setup of a disabled device."""
-    entry = configure_integration(hass)
-    with patch(
-        "homeassistant.components.devolo_home_control.HomeControl",
-        side_effect=[HomeControlMockDisabledBinarySensor(), HomeControlMock()],
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-    assert hass.states.get(f"{DOMAIN}.test_door") is None
+    assert hass.states.get(DOOR_ENTITY_ID) is None
 
 
 @pytest.mark.usefixtures("mock_zeroconf")
-async def test_remove_from_hass(hass: HomeAssistant) -> None:
+@pytest.mark.parametrize("integration", [HomeControlMockBinarySensor], indirect=True)
+async def test_remove_from_hass(
+    hass: HomeAssistant, integration: tuple[MockConfigEntry, HomeControlMock]
+) -> None:
     """Test removing entity."""
-    entry = configure_integration(hass)
-    test_gateway = HomeControlMockBinarySensor()
-    with patch(
-        "homeassistant.components.devolo_home_control.HomeControl",
-        side_effect=[test_gateway, HomeControlMock()],
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+    entry, test_gateway = integration
 
-    state = hass.states.get(f"{DOMAIN}.test_door")
+    state = hass.states.get(DOOR_ENTITY_ID)
     assert state is not None
     await hass.config_entries.async_remove(entry.entry_id)
     await hass.async_block_till_done()